@@ -1,7 +1,7 @@
-from typing import Callable, TYPE_CHECKING
+from typing import Callable, Optional, TYPE_CHECKING
 
 from .dataclass import dataclass
-from .dispatch import DispatchError, MultiDispatch
+from .dispatch import DispatchError, MultiDispatch, DEFAULT_CACHE_SIZE
 from .validation import (PythonTyping, TypeSystem, TypeMismatchError,
                          assert_isa, isa, issubclass, validate_func, is_subtype)
 from .pytypes import Constraint, String, Int, cv_type_checking
@@ -17,7 +17,11 @@ __all__ = (
     'multidispatch', 'multidispatch_final',
 )
 
-def Dispatch(typesystem: TypeSystem = PythonTyping()):
+def Dispatch(
+    typesystem: TypeSystem = PythonTyping(),
+    cache_size: Optional[int] = DEFAULT_CACHE_SIZE,
+    shared_cache: bool = False,
+):
     """Creates a decorator attached to a dispatch group,
     that when applied to a function, enables multiple-dispatch for it.
 
@@ -25,9 +29,13 @@ def Dispatch(typesystem: TypeSystem = PythonTyping()):
 
     Parameters:
         typesystem (Typesystem): Which type-system to use for dispatch. Default is Python's.
+        cache_size: maximum number of signatures to memoize per function. When full, the oldest
+                    entry is evicted (FIFO), because LRU would cost extra work on every hit.
+                    None means unbounded, and 0 disables memoization.
+        shared_cache: if True, memoize in a process-wide cache, shared by all the dispatchers that set it.
     """
 
-    return MultiDispatch(typesystem)
+    return MultiDispatch(typesystem, cache_size=cache_size, shared_cache=shared_cache)
 
 
 
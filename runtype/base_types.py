@@ -111,10 +111,13 @@ class SumType(Type):
     @classmethod
     def create(cls, types):
         x = set()
-        for t in types:
+        # Iterate with an explicit stack, so that nested SumTypes are flattened at any depth
+        stack = list(types)
+        while stack:
+            t = stack.pop()
             if isinstance(t, SumType):
                 # Optimization: Flatten recursive SumTypes
-                x |= set(t.types)
+                stack.extend(t.types)
             elif isinstance(t, AllType):
                 # This is more than an optimization, as it allows users to say:
                 # (All + x) is All
@@ -286,7 +289,7 @@ def le(self, other):
 def le(self: Type, other: Type):
     return self == other
 
-@dp
+# ge() has a single definition, so it skips the dispatch and calls le() directly
 def ge(self, other):
     return le(other, self)
 
@@ -355,6 +358,21 @@ def le(self: SumType, other: Type):
 def le(self: Type, other: SumType):
     return any(self <= t for t in other.types)
 
+@dp(priority=52)
+def le(self: SumType, other: SumType):
+    # Same as combining the two rules above, but loops directly over both sums,
+    # instead of dispatching again on 'other' for each member of 'self'.
+    other_types = other.types
+    for t in self.types:
+        if t in other_types:
+            continue
+        for t2 in other_types:
+            if t <= t2:
+                break
+        else:
+            return False
+    return True
+
 
 # le() for ProductType
 
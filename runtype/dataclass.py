@@ -22,11 +22,10 @@ else:
 
 
 from .common import CHECK_TYPES
-from .validation import TypeMismatchError, ensure_isa as default_ensure_isa
+from .validation import TypeMismatchError, ensure_isa as default_ensure_isa, isa
 from .pytypes import TypeCaster, SumType, NoneType, ATypeCaster, PythonType, type_caster
 
 Required = object()
-Skip = object()
 MAX_SAMPLE_SIZE = 16
 
 IS_PY310 = sys.version_info >= (3, 10)
@@ -136,33 +135,67 @@ def _get_field_type(type_caster, field):
             type_ = ForwardRef(type_)
         type_ = type_caster.to_canon(type_)
         if field.default is None:
-            type_ = SumType([type_, NoneType])
+            type_ = SumType.create([type_, NoneType])
         type_caster.cache[id(field)] = type_
         return type_
 
 
-def _validate_attr(config, should_cast, sampler, obj, name, type_, value):
-    try:
-        if should_cast:  # Basic cast
-            assert not sampler
-            try:
-                config.ensure_isa(value, type_, sampler)
-                return value
-            except TypeMismatchError:
-                return config.cast(value, type_)
+def _attr_type_error(obj, name, type_, value, e):
+    item_value, item_type = e.args
+    msg = f"[{type(obj).__name__}] Attribute '{name}' expected a value of type '{type_}'."
+    msg += f" Instead got type '{type(value).__name__}', with value {value!r}."
+    if item_value is not value:
+        msg += f"\n\n    Failed on item: {item_value!r}, expected type {item_type}"
+    return TypeError(msg)
+
+
+def _make_validate_attr(config, should_cast, sampler):
+    """Returns a validator for attribute values, specialized for the given options.
+
+    The options are resolved once per class, so that the validator doesn't have to branch on them.
+    The validator returns the value that should be stored, which is 'value' itself unless it was cast.
+    """
+    ensure_isa = config.ensure_isa
+
+    if should_cast:  # Basic cast
+        assert not sampler
+        cast = config.cast
+
+        if ensure_isa is default_ensure_isa:
+            # Test the value instead, so values that need a cast don't raise and catch an exception first
+            def validate_attr(obj, name, type_, value):
+                if isa(value, type_):
+                    return value
+                try:
+                    return cast(value, type_)
+                except TypeMismatchError as e:
+                    raise _attr_type_error(obj, name, type_, value, e)
+
         else:
-            config.ensure_isa(value, type_, sampler)
-    except TypeMismatchError as e:
-        item_value, item_type = e.args
-        msg = f"[{type(obj).__name__}] Attribute '{name}' expected a value of type '{type_}'."
-        msg += f" Instead got type '{type(value).__name__}', with value {value!r}."
-        if item_value is not value:
-            msg += f"\n\n    Failed on item: {item_value!r}, expected type {item_type}"
-        raise TypeError(msg)
-    return Skip
-
-
-def _post_init(self, config, should_cast, sampler, type_caster):
+
+            def validate_attr(obj, name, type_, value):
+                try:
+                    try:
+                        ensure_isa(value, type_)
+                        return value
+                    except TypeMismatchError:
+                        return cast(value, type_)
+                except TypeMismatchError as e:
+                    raise _attr_type_error(obj, name, type_, value, e)
+
+    else:
+
+        def validate_attr(obj, name, type_, value):
+            try:
+                ensure_isa(value, type_, sampler)
+            except TypeMismatchError as e:
+                raise _attr_type_error(obj, name, type_, value, e)
+            return value
+
+    return validate_attr
+
+
+def _post_init(self, validate_attr, type_caster):
     for name, field in getattr(self, "__dataclass_fields__", {}).items():
         value = getattr(self, name)
 
@@ -170,8 +203,8 @@ def _post_init(self, config, should_cast, sampler, type_caster):
             raise TypeError(f"Field {name} requires a value")
 
         type_ = _get_field_type(type_caster, field)
-        new_value = _validate_attr(config, should_cast, sampler, self, name, type_, value)
-        if new_value is not Skip:
+        new_value = validate_attr(self, name, type_, value)
+        if new_value is not value:
             object.__setattr__(self, name, new_value)
 
 
@@ -183,15 +216,15 @@ def _post_init__no_check_types(self):
             raise TypeError(f"Field {name} requires a value")
 
 
-def _setattr(obj, setattr, name, value, config, should_cast, sampler, type_caster):
+def _setattr(obj, setattr, name, value, validate_attr, type_caster):
     try:
         field = obj.__dataclass_fields__[name]
     except (KeyError, AttributeError):
-        new_value = Skip
+        pass
     else:
         type_ = _get_field_type(type_caster, field)
-        new_value = _validate_attr(config, should_cast, sampler, obj, name, type_, value)
-    setattr(obj, name, value if new_value is Skip else new_value)
+        value = validate_attr(obj, name, type_, value)
+    setattr(obj, name, value)
 
 
 def replace(inst, **kwargs):
@@ -308,17 +341,11 @@ def _process_class(cls: type, context_frame, config: Configuration, check_types,
     if check_types:
         sampler = _sample if check_types == "sample" else None
         type_caster = config.make_type_caster(context_frame)
-        should_cast = check_types == "cast"
+        validate_attr = _make_validate_attr(config, check_types == "cast", sampler)
 
         def __post_init__(self):
             # Only now context_frame has complete information
-            _post_init(
-                self,
-                config=config,
-                should_cast=should_cast,
-                sampler=sampler,
-                type_caster=type_caster,
-            )
+            _post_init(self, validate_attr, type_caster)
             if orig_post_init is not None:
                 orig_post_init(self)
 
@@ -328,16 +355,7 @@ def _process_class(cls: type, context_frame, config: Configuration, check_types,
             orig_set_attr = getattr(cls, "__setattr__")
 
             def __setattr__(self, name, value):
-                _setattr(
-                    self,
-                    orig_set_attr,
-                    name,
-                    value,
-                    config,
-                    should_cast,
-                    sampler,
-                    type_caster,
-                )
+                _setattr(self, orig_set_attr, name, value, validate_attr, type_caster)
 
             c.__setattr__ = __setattr__
     else:
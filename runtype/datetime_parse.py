@@ -157,6 +157,28 @@ def parse_time(value: str) -> time:
         raise TimeError()
 
 
+def _parse_plain_datetime(value: str) -> Optional[datetime]:
+    """
+    Parse the most common format, 'YYYY-MM-DD HH:MM:SS' (or with a 'T' separator), by slicing.
+
+    Return None if the value isn't in exactly this format.
+    """
+    if (
+        len(value) == 19 and value.isascii()
+        and value[4] == '-' and value[7] == '-' and value[10] in 'T ' and value[13] == ':' and value[16] == ':'
+    ):
+        digits = value[:4] + value[5:7] + value[8:10] + value[11:13] + value[14:16] + value[17:]
+        if digits.isdigit():
+            try:
+                return datetime(
+                    int(digits[:4]), int(digits[4:6]), int(digits[6:8]),
+                    int(digits[8:10]), int(digits[10:12]), int(digits[12:])
+                )
+            except ValueError:
+                raise DateTimeError()
+    return None
+
+
 def parse_datetime(value: str) -> datetime:
     """
     Parse a datetime/int/float/string and return a datetime.datetime.
@@ -168,6 +190,12 @@ def parse_datetime(value: str) -> datetime:
     Raise ValueError if the input isn't well formatted.
     """
 
+    # Fast path, which skips both the numeric attempt and the regex
+    if isinstance(value, str):
+        dt = _parse_plain_datetime(value)
+        if dt is not None:
+            return dt
+
     number = get_numeric(value, 'datetime')
     if number is not None:
         return from_unix_seconds(number)
@@ -1,6 +1,6 @@
 from collections import defaultdict
 from functools import wraps
-from typing import Any, Dict, Callable, Sequence
+from typing import Any, Dict, Callable, Sequence, Optional
 from operator import itemgetter
 import warnings
 
@@ -10,6 +10,15 @@ from .utils import get_func_signatures
 from .typesystem import TypeSystem
 
 
+DEFAULT_CACHE_SIZE = 4096
+
+# Maximum number of signatures in the shared cache, for all the trees that use it together
+SHARED_CACHE_SIZE = 4 * DEFAULT_CACHE_SIZE
+
+# Dispatch cache for trees created with shared_cache=True. Keys are (tree, signature).
+_shared_cache: Dict[tuple, Callable] = {}
+
+
 class DispatchError(Exception):
     "Thrown whenever a dispatch fails. Contains text describing the conflict."
 
@@ -22,11 +31,23 @@ class MultiDispatch:
         typesystem (Typesystem): Which type-system to use for dispatch.
         test_subtypes: indices of params that should be matched by subclass instead of isinstance.
                         (will be soon deprecated and replaced by using Type[..] annotations)
+        cache_size: maximum number of signatures to memoize per function. None means unbounded,
+                    and 0 disables memoization.
+        shared_cache: if True, memoize in a process-wide cache, shared by all the dispatchers that set it.
+                      The shared cache is bounded by SHARED_CACHE_SIZE, so cache_size only matters if it's 0.
     """
 
-    def __init__(self, typesystem: TypeSystem, test_subtypes: Sequence[int] = ()):
+    def __init__(
+        self,
+        typesystem: TypeSystem,
+        test_subtypes: Sequence[int] = (),
+        cache_size: Optional[int] = DEFAULT_CACHE_SIZE,
+        shared_cache: bool = False,
+    ):
         self.fname_to_tree: Dict[str, TypeTree] = {}
         self.typesystem: TypeSystem = typesystem
+        self.cache_size = cache_size
+        self.shared_cache = shared_cache
         if test_subtypes:
             warnings.warn("The test_subtypes option is deprecated and will be removed in the future."
                           "Use typing.Type[t] instead.", DeprecationWarning)
@@ -55,21 +76,30 @@ class MultiDispatch:
             tree = self.fname_to_tree[fname]
         except KeyError:
             tree = self.fname_to_tree[fname] = TypeTree(
-                fname, self.typesystem, self.test_subtypes
+                fname, self.typesystem, self.test_subtypes, self.cache_size, self.shared_cache
             )
 
         tree.define_function(func)
-        find_function_cached = tree.find_function_cached
 
-        @wraps(func)
-        def dispatched_f(*args, **kw):
-            # Done in two steps to help debugging
-            f = find_function_cached(args)
-            return f(*args, **kw)
+        if tree.test_subtypes:
+            find_function_cached = tree.find_function_cached
+
+            @wraps(func)
+            def dispatched_f(*args, **kw):
+                # Done in two steps to help debugging
+                f = find_function_cached(args)
+                return f(*args, **kw)
+        else:
+            dispatched_f = wraps(func)(_make_dispatched_f(tree))
 
         dispatched_f.__dispatcher__ = self
         return dispatched_f
 
+    def clear_cache(self):
+        "Forget all the memoized dispatch results of this dispatcher"
+        for tree in self.fname_to_tree.values():
+            tree.clear_cache()
+
     def __enter__(self):
         return self
 
@@ -77,6 +107,47 @@ class MultiDispatch:
         pass
 
 
+_DISPATCHED_F_TEMPLATE = """
+def dispatched_f(*args, **kw):
+    if len(args) == {arity}:
+        sig = {sig}
+    else:
+        sig = {generic_sig}
+    f = cache_get(sig)
+    if f is None:
+        f = cache_miss(sig, args)
+    return f(*args, **kw)
+"""
+
+def _make_dispatched_f(tree):
+    """Generates the dispatch wrapper for the given tree.
+
+    This is an inlined version of TypeTree.find_function_cached, in which the
+    signature tuple is unrolled for the longest arity defined so far.
+    Calls with any other number of arguments take the generic path.
+    """
+    arity = tree.max_arity
+    # Call the builtin directly when possible, skipping the typesystem's indirection
+    get_type = "type" if tree._get_type is type else "get_type"
+    sig = "(%s)" % "".join(f"{get_type}(args[{i}]), " for i in range(arity))
+    generic_sig = f"tuple(map({get_type}, args))"
+    if tree.shared_cache:
+        sig = f"(tree, {sig})"
+        generic_sig = f"(tree, {generic_sig})"
+    code = compile(
+        _DISPATCHED_F_TEMPLATE.format(arity=arity, sig=sig, generic_sig=generic_sig), "<dispatch>", "exec"
+    )
+
+    namespace = {
+        "tree": tree,
+        "cache_get": tree._cache.get,
+        "cache_miss": tree._cache_miss,
+        "get_type": tree._get_type,
+    }
+    exec(code, namespace)
+    return namespace["dispatched_f"]
+
+
 @dataclass
 class MultiDispatchWithOptions:
     dispatch: MultiDispatch
@@ -88,58 +159,122 @@ class MultiDispatchWithOptions:
 
 
 class TypeNode:
+    __slots__ = ("follow_type", "func")
+
     def __init__(self):
         self.follow_type = defaultdict(TypeNode)
         self.func = None
 
-    def follow_arg(self, arg, ts, test_subtype=False):
+    def follow_arg(self, arg, isinstance, out):
+        "Appends to 'out' the child nodes whose type matches 'arg'"
+        arg_type = type(arg)
         for type_, tree in self.follow_type.items():
-            if test_subtype:
-                if ts.issubclass(arg, type_):
-                    yield tree
-            elif ts.isinstance(arg, type_):
-                yield tree
+            # An exact match of the type doesn't require calling isinstance
+            if type_ is arg_type or isinstance(arg, type_):
+                out.append(tree)
+
+    def follow_subtype(self, arg, issubclass, out):
+        "Appends to 'out' the child nodes whose type is a superclass of 'arg'"
+        for type_, tree in self.follow_type.items():
+            if issubclass(arg, type_):
+                out.append(tree)
 
 
 class TypeTree:
-    root: TypeNode
+    roots: Dict[int, TypeNode]
     name: str
+    max_arity: int
     _cache: Dict[tuple, Callable]
+    _resolution_cache: Dict[tuple, Callable]
     typesystem: TypeSystem
     test_subtypes: Sequence[int]
-
-    def __init__(self, name: str, typesystem: TypeSystem, test_subtypes: Sequence[int]):
-        self.root = TypeNode()
-        self._cache = {}
+    cache_size: Optional[int]
+    _cache_limit: Optional[int]
+    shared_cache: bool
+
+    def __init__(
+        self,
+        name: str,
+        typesystem: TypeSystem,
+        test_subtypes: Sequence[int],
+        cache_size: Optional[int] = DEFAULT_CACHE_SIZE,
+        shared_cache: bool = False,
+    ):
+        self.roots = defaultdict(TypeNode)   # One tree per arity
+        # With cache_size=0 nothing is memoized, so the shared cache isn't used even for lookups
+        self._cache = _shared_cache if shared_cache and cache_size != 0 else {}
+        self.cache_size = cache_size
+        self._cache_limit = SHARED_CACHE_SIZE if shared_cache and cache_size != 0 else cache_size
+        self.shared_cache = shared_cache
+        self._resolution_cache = {}
+        self.max_arity = 0
         self.name = name
         self.typesystem = typesystem
         self.test_subtypes = test_subtypes
-        self._get_type = self.typesystem.get_type
+        self._get_type = typesystem.get_type
+        self._isinstance = typesystem.isinstance
+        self._issubclass = typesystem.issubclass
+        self._any_type = typesystem.any_type
 
         if self.test_subtypes:
             # Deprecated!!
             self.find_function_cached = self._old_find_function_cached
 
     def get_arg_types(self, args):
-        if self.test_subtypes:
-            # TODO can be made more efficient
-            return tuple(
-                (a if i in self.test_subtypes else self._get_type(a))
+        get_type = self._get_type
+        test_subtypes = self.test_subtypes
+        if test_subtypes:
+            return tuple([
+                (a if i in test_subtypes else get_type(a))
                 for i, a in enumerate(args)
-            )
+            ])
+        return tuple([get_type(a) for a in args])
 
-        return tuple(map(self._get_type, args))
+    def _match_nodes(self, args):
+        "Returns the nodes that match the given arguments"
+        if self.test_subtypes:
+            return self._match_nodes_with_subtypes(args)
+
+        isinstance = self._isinstance
+
+        root = self.roots.get(len(args))
+        nodes = [root] if root is not None else []
+        next_nodes = []
+        for a in args:
+            for node in nodes:
+                node.follow_arg(a, isinstance, next_nodes)
+            # Swap the lists, to reuse them for the next argument
+            nodes, next_nodes = next_nodes, nodes
+            next_nodes.clear()
+        return nodes
+
+    def _match_nodes_with_subtypes(self, args):
+        "Like _match_nodes(), but matches the params in test_subtypes by subclass"
+        isinstance = self._isinstance
+        issubclass = self._issubclass
+        test_subtypes = self.test_subtypes
+
+        root = self.roots.get(len(args))
+        nodes = [root] if root is not None else []
+        next_nodes = []
+        for i, a in enumerate(args):
+            if i in test_subtypes:
+                for node in nodes:
+                    node.follow_subtype(a, issubclass, next_nodes)
+            else:
+                for node in nodes:
+                    node.follow_arg(a, isinstance, next_nodes)
+            nodes, next_nodes = next_nodes, nodes
+            next_nodes.clear()
+        return nodes
 
     def find_function(self, args):
-        nodes = [self.root]
-        for i, a in enumerate(args):
-            nodes = [
-                n
-                for node in nodes
-                for n in node.follow_arg(
-                    a, self.typesystem, test_subtype=i in self.test_subtypes
-                )
-            ]
+        nodes = self._match_nodes(args)
+        if len(nodes) == 1:
+            # Fast path for the common case
+            func = nodes[0].func
+            if func is not None:
+                return func[0]
 
         funcs = [node.func for node in nodes if node.func]
 
@@ -148,7 +283,12 @@ class TypeTree:
                 f"Function '{self.name}' not found for signature {self.get_arg_types(args)}"
             )
         elif len(funcs) > 1:
-            f, _sig = self.choose_most_specific_function(args, *funcs)
+            # The choice depends only on the candidates, so we can reuse it for other signatures
+            candidates = tuple(map(id, funcs))
+            f = self._resolution_cache.get(candidates)
+            if f is None:
+                f, _sig = self.choose_most_specific_function(args, *funcs)
+                self._resolution_cache[candidates] = f
         else:
             ((f, _sig),) = funcs
         return f
@@ -156,26 +296,45 @@ class TypeTree:
     def _old_find_function_cached(self, args):
         "Memoized version of find_function"
         sig = self.get_arg_types(args)
-        try:
-            return self._cache[sig]
-        except KeyError:
-            f = self.find_function(args)
-            self._cache[sig] = f
-            return f
+        if self.shared_cache:
+            sig = self, sig
+        f = self._cache.get(sig)
+        if f is None:
+            f = self._cache_miss(sig, args)
+        return f
 
     def find_function_cached(self, args):
         "Memoized version of find_function"
-        try:
-            return self._cache[tuple(map(self._get_type, args))]
-        except KeyError:
-            sig = tuple(map(self._get_type, args))
-            f = self.find_function(args)
-            self._cache[sig] = f
-            return f
+        sig = tuple(map(self._get_type, args))
+        if self.shared_cache:
+            sig = self, sig
+        f = self._cache.get(sig)
+        if f is None:
+            f = self._cache_miss(sig, args)
+        return f
+
+    def _cache_miss(self, sig, args):
+        f = self.find_function(args)
+        limit = self._cache_limit
+        if limit == 0:
+            return f  # cache_size=0 disables memoization
+        cache = self._cache
+        if limit is not None and len(cache) >= limit:
+            # Evict the oldest entry. (LRU would cost extra work on every hit)
+            del cache[next(iter(cache))]
+        cache[sig] = f
+        return f
+
+    def clear_cache(self):
+        if self.shared_cache:
+            for key in [k for k in self._cache if k[0] is self]:
+                del self._cache[key]
+        else:
+            self._cache.clear()
 
     def define_function(self, f):
         for signature in get_func_signatures(self.typesystem, f):
-            node = self.root
+            node = self.roots[len(signature)]
             for t in signature:
                 if not isinstance(t, type):
                     # XXX this is a temporary fix for preventing certain types from being used for dispatch
@@ -189,29 +348,29 @@ class TypeTree:
                     f"Function {f.__name__} at {code_obj.co_filename}:{code_obj.co_firstlineno} matches existing signature: {signature}!"
                 )
             node.func = f, signature
+            self.max_arity = max(self.max_arity, len(signature))
 
     def choose_most_specific_function(self, args, *funcs):
-        issubclass = self.typesystem.issubclass
-        any_type = self.typesystem.any_type
-
-        class IsSubclass:
-            def __init__(self, k):
-                self.i, self.t = k
-
-            def __lt__(self, other):
-                if self.t is any_type:
-                    return False
-                return issubclass(self.t, other.t)
+        issubclass = self._issubclass
+        any_type = self._any_type
 
         most_specific_per_param = []
         sigs = [f[1] for f in funcs]
         for arg_idx, zipped_params in enumerate(zip(*sigs)):
             if all_eq(zipped_params):
                 continue
-            x = sorted(enumerate(zipped_params), key=IsSubclass)
-            ms_i, ms_t = x[0]  # Most significant index and type
+
+            # Find the most significant index and type, in a single pass
+            ms_i, ms_t = 0, zipped_params[0]
+            for i in range(1, len(zipped_params)):
+                t = zipped_params[i]
+                if ms_t is any_type or (issubclass(t, ms_t) and t is not any_type):
+                    ms_i, ms_t = i, t
+
             ms_set = {ms_i}  # Init set of indexes of most significant params
-            for i, t in x[1:]:
+            for i, t in enumerate(zipped_params):
+                if i == ms_i:
+                    continue
                 if ms_t == t:
                     # Add more indexes with the same type
                     ms_set.add(i)
@@ -251,9 +410,5 @@ class TypeTree:
         raise DispatchError(msg)
 
 
-def all_eq(xs):
-    a = xs[0]
-    for b in xs[1:]:
-        if a != b:
-            return False
-    return True
+def all_eq(xs: Sequence) -> bool:
+    return xs.count(xs[0]) == len(xs)
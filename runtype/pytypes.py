@@ -6,12 +6,14 @@ import io
 import typing as t
 import contextvars
 import types
-from abc import abstractmethod, ABC
+from abc import abstractmethod, ABC, ABCMeta
 from contextlib import suppress
 import collections
 from collections import abc
+from itertools import repeat
 import sys
 import typing
+import weakref
 from datetime import datetime, date, time, timedelta
 from types import FrameType
 
@@ -26,6 +28,16 @@ except ImportError:
     typing_extensions = None
 
 
+def _optional_types(*module_attrs):
+    "Returns a tuple of the attributes that exist in their module (varies by Python version), for use with isinstance()"
+    return tuple(getattr(m, attr) for m, attr in module_attrs if m is not None and hasattr(m, attr))
+
+# Resolved once here, instead of probing the modules on every call to TypeCaster._to_canon()
+_union_types = _optional_types((types, 'UnionType'))
+_annotated_alias_types = _optional_types((typing, '_AnnotatedAlias'), (typing_extensions, '_AnnotatedAlias'))
+_annotated_meta_types = _optional_types((typing_extensions, 'AnnotatedMeta'))
+
+
 
 class LengthMismatchError(TypeMismatchError):
     pass
@@ -44,7 +56,9 @@ class Constraint(base_types.Constraint):
         super().__init__(type_caster.to_canon(for_type), predicates)
 
     def cast_from(self, obj):
-        obj = self.type.cast_from(obj)
+        # Skip the cast when obj is already of the right type, and only apply the predicates
+        if not self.type.test_instance(obj):
+            obj = self.type.cast_from(obj)
 
         for p in self.predicates:
             if not p(obj):
@@ -72,30 +86,87 @@ Any = AnyType()
 All = AllType()
 
 
+_PRODUCT_VALIDATORS_TEMPLATE = """
+def test_instance(obj, sampler=None):
+    if (type(obj) is not tuple and not isinstance(obj, tuple)) or len(obj) != {arity}:
+        return False
+    return {tests}
+
+def validate_instance(obj, sampler=None):
+    if type(obj) is not tuple and not isinstance(obj, tuple):
+        raise TypeMismatchError(obj, tuple)
+    if len(obj) != {arity}:
+        raise LengthMismatchError(product, obj)
+{validations}
+"""
+
+def _make_product_validators(product):
+    """Generates test_instance() and validate_instance() functions for a product with (non-empty) item types.
+
+    The length is a constant and the per-item checks are unrolled. Items of plain data types
+    are tested with isinstance() directly, instead of going through their methods.
+    """
+    namespace = {
+        "product": product,
+        "TypeMismatchError": TypeMismatchError,
+        "LengthMismatchError": LengthMismatchError,
+    }
+    tests = []
+    validations = []
+    for i, t in enumerate(product.types):
+        kernel = _plain_kernel(t)
+        if kernel is not None:
+            namespace[f"k{i}"] = kernel
+            namespace[f"t{i}"] = t
+            tests.append(f"isinstance(obj[{i}], k{i})")
+            validations.append(f"    if not isinstance(obj[{i}], k{i}): raise TypeMismatchError(obj[{i}], t{i})")
+        else:
+            namespace[f"test{i}"] = t.test_instance
+            namespace[f"validate{i}"] = t.validate_instance
+            tests.append(f"test{i}(obj[{i}], sampler)")
+            validations.append(f"    validate{i}(obj[{i}], sampler)")
+    code = compile(
+        _PRODUCT_VALIDATORS_TEMPLATE.format(
+            arity=len(product.types), tests=" and ".join(tests), validations="\n".join(validations)
+        ),
+        "<tuple>",
+        "exec",
+    )
+    exec(code, namespace)
+    return namespace["test_instance"], namespace["validate_instance"]
+
+
 class ProductType(base_types.ProductType, PythonType):
     """Used for Tuple
     """
+    def _specialize(self):
+        # Optimization for instance validation. Done on first use, because many products
+        # (like the arguments of Callable) are never validated, and generating the code isn't free.
+        # (Methods bound before specializing, e.g. by SumType, keep calling through here)
+        if "test_instance" not in self.__dict__:
+            self.test_instance, self.validate_instance = _make_product_validators(self)
+
     def validate_instance(self, obj, sampler=None):
+        if self.types:
+            self._specialize()
+            return self.validate_instance(obj, sampler)
         if not isinstance(obj, tuple):
             raise TypeMismatchError(obj, tuple)
-        if self.types and len(obj) != len(self.types):
-            raise LengthMismatchError(self, obj)
-        for type_, item in zip(self.types, obj):
-            type_.validate_instance(item, sampler)
-    
+
     def test_instance(self, obj, sampler=None):
-        if not isinstance(obj, tuple):
-            return False
-        if self.types and len(obj) != len(self.types):
-            return False
-        for type_, item in zip(self.types, obj):
-            if not type_.test_instance(item, sampler):
-                return False
-        return True
+        if self.types:
+            self._specialize()
+            return self.test_instance(obj, sampler)
+        return isinstance(obj, tuple)
 
 
 class SumType(base_types.SumType, PythonType):
     def __init__(self, types: typing.Sequence[PythonType]):
+        # Flatten nested sums here too, for instances that weren't made with create().
+        # The nested sums were flattened by their own __init__, so one level is enough.
+        if any(isinstance(t, base_types.SumType) for t in types):
+            types = [t2 for t in types for t2 in (t.types if isinstance(t, base_types.SumType) else (t,))]
+
         # Here we merge all the instances of OneOf into a single one (if necessary).
         # The alternative is to turn all OneOf instances into SumTypes of single values.
         # I chose this method due to intuition that it's faster for the common use-case.
@@ -105,59 +176,126 @@ class SumType(base_types.SumType, PythonType):
             types = rest + [OneOf([v for t in one_ofs for v in t.values])]
         super().__init__(types)
 
-        # Optimization for instance validation
-        data_types = []
-        self.other_types = []
+        # Optimization for instance validation:
+        # Data types are tested together with a single isinstance() call,
+        # and only the remaining types are tested one by one, through their bound test_instance().
+        data_types: typing.List[type] = []
+        literal_tests: typing.List[typing.Callable[..., bool]] = []
+        other_tests: typing.List[typing.Callable[..., bool]] = []
         for t in types:
             if isinstance(t, PythonDataType):
                 data_types.append(t.kernel)
+            elif isinstance(t, _NoneType):
+                # Common in Optional[...]. Lets isinstance() test for None, along with the rest
+                data_types.append(type(None))
+            elif t is Any or t is All:
+                # Every instance matches, so the other types never need to be tested
+                data_types = [object]
+                literal_tests = other_tests = []
+                break
+            elif isinstance(t, OneOf):
+                literal_tests.append(t.test_instance)
             else:
-                self.other_types.append(t)
+                other_tests.append(t.test_instance)
         self.data_types = tuple(data_types)
-                
+        # Literals are a set lookup, so they're tested before the (possibly recursive) generic types
+        self.other_tests = tuple(literal_tests + other_tests)
 
-    def validate_instance(self, obj, sampler=None):
+        # Counts the matches of the test at each position, in order to move frequent ones forward
+        self._test_hits: typing.List[int] = [0] * len(self.other_tests)
+
+        if not self.other_tests:
+            # Only data types, so a single isinstance() call decides
+            self.test_instance = self._test_data_types
+            self.validate_instance = self._validate_data_types
+
+    def _test_data_types(self, obj, sampler=None):
+        return isinstance(obj, self.data_types)
+
+    def _validate_data_types(self, obj, sampler=None):
+        if not isinstance(obj, self.data_types):
+            raise TypeMismatchError(obj, self)
+
+    def _promote_test(self, i):
+        # Swaps the test at position i with its predecessor, once it has matched more times.
+        # Instances are interned, and so shared between callers (and threads). A race may
+        # swap the wrong neighbours, but other_tests is only ever replaced by a permutation of itself.
+        hits = self._test_hits
+        hits[i] += 1
+        if hits[i] > hits[i - 1]:
+            tests = list(self.other_tests)
+            tests[i - 1], tests[i] = tests[i], tests[i - 1]
+            hits[i - 1], hits[i] = hits[i], hits[i - 1]
+            self.other_tests = tuple(tests)
+
+    def _validate_members(self, obj, sampler=None):
         if isinstance(obj, self.data_types):
             return
-        for t in self.other_types:
-            if t.test_instance(obj):
-                return 
+        tests = self.other_tests
+        for i, test in enumerate(tests):
+            if test(obj):
+                # With two tests, reordering saves at most one call, which the counting would cost anyway
+                if i and len(tests) > 2:
+                    self._promote_test(i)
+                return
         raise TypeMismatchError(obj, self)
 
-    def test_instance(self, obj, sampler=None):
+    def _test_members(self, obj, sampler=None):
         if isinstance(obj, self.data_types):
             return True
-        for t in self.other_types:
-            if t.test_instance(obj):
+        tests = self.other_tests
+        for i, test in enumerate(tests):
+            if test(obj):
+                # With two tests, reordering saves at most one call, which the counting would cost anyway
+                if i and len(tests) > 2:
+                    self._promote_test(i)
                 return True
         return False
 
+    # Attributes, so that __init__ can bind the variant that suits the members
+    validate_instance: typing.Callable[..., None] = _validate_members
+    test_instance: typing.Callable[..., bool] = _test_members
+
     def cast_from(self, obj):
+        # Values that already match need no cast, and shouldn't raise and catch an exception per member
+        if self.test_instance(obj):
+            return obj
+
+        # Plain try/except, to avoid creating a suppress() context manager per member
         for t in self.types:
-            with suppress(TypeError):
-               return t.cast_from(obj)
+            try:
+                return t.cast_from(obj)
+            except TypeError:
+                pass
 
         raise TypeMismatchError(obj, self)
 
 
-# def _flatten_types(t):
-#     if isinstance(t, SumType):
-#         for t in t.types:
-#             yield from _flatten_types(t)
-#     else:
-#         yield t
-
-
 
 class PythonDataType(DataType, PythonType):
     kernel: type
 
+    # Whether validate_instance() may inline test_instance(), i.e. it isn't overridden
+    _inline_test: bool = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._inline_test = cls.test_instance is PythonDataType.test_instance
+
     def __init__(self, kernel, supertypes={Any}):
         self.kernel = kernel
 
     def test_instance(self, obj, sampler=None):
         return isinstance(obj, self.kernel)
 
+    def validate_instance(self, obj, sampler=None):
+        if self._inline_test:
+            # Same as PythonType.validate_instance(), without the extra call to test_instance()
+            if not isinstance(obj, self.kernel):
+                raise TypeMismatchError(obj, self)
+        elif not self.test_instance(obj, sampler):
+            raise TypeMismatchError(obj, self)
+
     def __repr__(self):
         try:
             return str(self.kernel.__name__)
@@ -165,17 +303,17 @@ class PythonDataType(DataType, PythonType):
             return repr(self.kernel)
 
     def cast_from(self, obj):
+        if self.test_instance(obj):
+            return obj
+
         if isinstance(obj, dict):
             # kernel is probably a class. Cast the dict into the class.
             return self.kernel(**obj)
 
-        if not self.test_instance(obj):
-            cast = getattr(self.kernel, 'cast_from', None)
-            if cast:
-                return cast(obj)
-            raise
-
-        return obj
+        cast = getattr(self.kernel, 'cast_from', None)
+        if cast:
+            return cast(obj)
+        raise TypeMismatchError(obj, self)
 
     def __eq__(self, other):
         if type(other) != type(self):
@@ -186,9 +324,16 @@ class PythonDataType(DataType, PythonType):
         return hash((type(self), self.kernel))
 
 
+def _plain_kernel(t):
+    "Returns the kernel of 't' if testing it is just isinstance(obj, kernel), or None otherwise"
+    if isinstance(t, PythonDataType) and type(t).test_instance is PythonDataType.test_instance:
+        return t.kernel
+    return None
+
+
 class TupleType(PythonType):
     def test_instance(self, obj, sampler=None):
-        return isinstance(obj, tuple)
+        return type(obj) is tuple or isinstance(obj, tuple)
 
 
 # cv_type_checking allows the user to define different behaviors for their objects
@@ -197,6 +342,9 @@ class TupleType(PythonType):
 cv_type_checking = contextvars.ContextVar('type_checking', default=False)
 
 
+# Builtin classes whose __hash__ and __eq__ can't be affected by cv_type_checking
+_plain_literal_classes = frozenset({bool, int, float, str, bytes, type(None)})
+
 class OneOf(PythonType):
     values: typing.Sequence
 
@@ -205,10 +353,37 @@ class OneOf(PythonType):
     def __init__(self, values):
         self.values = values
 
+        # Optimization for instance validation: Hashable values are tested with a single set lookup,
+        # and only the unhashable ones need a linear scan.
+        hashable = []
+        self._unhashable_values = []
+        tok = cv_type_checking.set(True)
+        try:
+            for v in values:
+                try:
+                    hash(v)
+                except TypeError:
+                    self._unhashable_values.append(v)
+                else:
+                    hashable.append(v)
+        finally:
+            cv_type_checking.reset(tok)
+        self._value_set = frozenset(hashable)
+        # When both the values and the tested object are of plain classes, cv_type_checking can't matter
+        self._plain_values = all(type(v) in _plain_literal_classes for v in values)
+
     def test_instance(self, obj, sampler=None):
+        if self._plain_values and type(obj) in _plain_literal_classes:
+            return obj in self._value_set
+
         tok = cv_type_checking.set(True)
         try:
-            return obj in self.values
+            try:
+                if obj in self._value_set:
+                    return True
+            except TypeError:   # obj is not hashable
+                return obj in self.values
+            return obj in self._unhashable_values
         finally:
             cv_type_checking.reset(tok)
 
@@ -216,8 +391,9 @@ class OneOf(PythonType):
         return 'Literal[%s]' % ', '.join(map(repr, self.values))
 
     def cast_from(self, obj):
-        if obj not in self.values:
+        if not self.test_instance(obj):
             raise TypeMismatchError(obj, self)
+        return obj
 
 
 
@@ -230,12 +406,16 @@ class GenericType(base_types.GenericType, PythonType):
 
 class GenericContainerType(GenericType):
     def validate_instance(self, obj, sampler=None):
-        self.base.validate_instance(obj)
+        # Inlined self.base.validate_instance(obj), with a fast-path for the exact type
+        kernel = self.base.kernel
+        if type(obj) is not kernel and not isinstance(obj, kernel):
+            raise TypeMismatchError(obj, self.base)
         if not self.accepts_any:
             self.validate_instance_items(obj, sampler)
 
     def test_instance(self, obj, sampler=None):
-        if not self.base.test_instance(obj):
+        kernel = self.base.kernel
+        if type(obj) is not kernel and not isinstance(obj, kernel):
             return False
         return self.accepts_any or self.test_instance_items(obj, sampler)
 
@@ -247,10 +427,8 @@ class GenericContainerType(GenericType):
 
         return self.cast_from_items(obj)
 
-    @property
-    @abstractmethod
-    def accepts_any(self) -> bool:
-        ...
+    # Set by each subclass in __init__, because it's tested on every validation
+    accepts_any: bool
 
     @abstractmethod
     def validate_instance_items(self, items: t.Iterable, sampler):
@@ -265,23 +443,52 @@ class GenericContainerType(GenericType):
         ...
 
 class SequenceType(GenericContainerType):
-    @property
-    def accepts_any(self):
-        return self.item is Any
+    def __init__(self, base: PythonType, item: PythonType=Any, variance: Variance = Variance.Covariant):
+        super().__init__(base, item, variance)
+        self.accepts_any = self.item is Any
+        # Optimization for instance validation: Items of a plain data type only need an isinstance() check
+        self.item_kernel = _plain_kernel(self.item)
 
     def validate_instance_items(self, obj: t.Sequence, sampler):
+        kernel = self.item_kernel
+        if kernel is not None:
+            items = sampler(obj) if sampler else obj
+            # Sweep the items in C, and only look for the offending item if that fails
+            if all(map(isinstance, items, repeat(kernel))):
+                return
+            for item in items:
+                if not isinstance(item, kernel):
+                    raise TypeMismatchError(item, self.item)
+            # Can only get here if 'items' was a one-shot iterator
+            raise TypeMismatchError(obj, self)
+
+        # Bound once, instead of looking up the attributes for every item
+        validate_item = self.item.validate_instance
         for item in sampler(obj) if sampler else obj:
-            self.item.validate_instance(item, sampler)
+            validate_item(item, sampler)
 
     def test_instance_items(self, obj: t.Sequence, sampler) -> bool:
-        return all(
-            self.item.test_instance(item, sampler)
-            for item in (sampler(obj) if sampler else obj)
-        )
+        kernel = self.item_kernel
+        if kernel is not None:
+            # Runs the whole loop in C
+            return all(map(isinstance, sampler(obj) if sampler else obj, repeat(kernel)))
+
+        test_item = self.item.test_instance
+        for item in sampler(obj) if sampler else obj:
+            if not test_item(item, sampler):
+                return False
+        return True
 
     def cast_from_items(self, obj: t.Sequence):
+        kernel = self.item_kernel
+        # (Limited to the builtin collections, because the test consumes iterators)
+        if kernel is not None and isinstance(obj, (list, tuple, set, frozenset)):
+            if all(map(isinstance, obj, repeat(kernel))):
+                # The items are already of the right type
+                return obj if self.base.test_instance(obj) else self.base.kernel(obj)
+
         # Recursively cast each item
-        return self.base.kernel(self.item.cast_from(item) for item in obj)
+        return self.base.kernel(map(self.item.cast_from, obj))
 
 
 class DictType(GenericContainerType):
@@ -293,37 +500,70 @@ class DictType(GenericContainerType):
             assert len(item) == 2
             item = ProductType([type_caster.to_canon(x) for x in item])
         self.item = item
-
-    @property
-    def accepts_any(self):
-        return self.item is Any or self.item == Any*Any
+        self.accepts_any = item is Any or item == Any*Any
+        # Checked once here, rather than on every validation (isinstance() with an ABC is slow)
+        assert self.accepts_any or isinstance(item, base_types.ProductType), item
+
+        # Optimization for instance validation: Keys and values of plain data types only need an isinstance() check
+        self.item_kernels: t.Optional[t.Tuple[type, type]] = None
+        if isinstance(item, base_types.ProductType):
+            kt, vt = item.types
+            key_kernel = _plain_kernel(kt)
+            value_kernel = _plain_kernel(vt)
+            if key_kernel is not None and value_kernel is not None:
+                self.item_kernels = key_kernel, value_kernel
+
+    def _test_item_kernels(self, obj: t.Mapping) -> bool:
+        # Sweeps the keys and the values in C
+        item_kernels = self.item_kernels
+        assert item_kernels is not None
+        key_kernel, value_kernel = item_kernels
+        return all(map(isinstance, obj.keys(), repeat(key_kernel))) and all(
+            map(isinstance, obj.values(), repeat(value_kernel))
+        )
 
     def validate_instance_items(self, obj: t.Mapping, sampler):
-        assert isinstance(self.item, base_types.ProductType)
+        if self.item_kernels is not None and not sampler and self._test_item_kernels(obj):
+            return
+
+        # Validate item by item, to raise an error for the offending one
         kt, vt = self.item.types
+        validate_key = kt.validate_instance
+        validate_value = vt.validate_instance
         for k, v in sampler(obj.items()) if sampler else obj.items():
-            kt.validate_instance(k, sampler)
-            vt.validate_instance(v, sampler)
+            validate_key(k, sampler)
+            validate_value(v, sampler)
 
     def test_instance_items(self, obj: t.Mapping, sampler) -> bool:
-        assert isinstance(self.item, base_types.ProductType)
+        if self.item_kernels is not None and not sampler:
+            return self._test_item_kernels(obj)
+
         kt, vt = self.item.types
-        return all(
-            kt.test_instance(k, sampler) and vt.test_instance(v, sampler)
-            for k, v in (sampler(obj.items()) if sampler else obj.items())
-        )
+        test_key = kt.test_instance
+        test_value = vt.test_instance
+        for k, v in sampler(obj.items()) if sampler else obj.items():
+            if not (test_key(k, sampler) and test_value(v, sampler)):
+                return False
+        return True
 
     def __getitem__(self, item):
-        assert self.item == Any*Any
+        # Only the unparameterized Dict may be subscripted
+        assert self.accepts_any
         return type(self)(self.base, item, self.variance)
 
     def cast_from_items(self, obj: t.Mapping):
         # Must already be a dict
         self.base.validate_instance(obj)
 
+        if self.item_kernels is not None and self._test_item_kernels(obj):
+            # The keys and values are already of the right type
+            return obj
+
         # Recursively cast each item
         kt, vt = self.item.types
-        return {kt.cast_from(k): vt.cast_from(v) for k, v in obj.items()}
+        cast_key = kt.cast_from
+        cast_value = vt.cast_from
+        return {cast_key(k): cast_value(v) for k, v in obj.items()}
 
 class TupleEllipsisType(SequenceType):
     def __repr__(self):
@@ -347,9 +587,21 @@ class CallableType(PythonDataType):
         args, ret = signature
         return type(self)(args, ret)
 
+    def test_instance(self, obj, sampler=None):
+        # Same as isinstance(obj, typing.Callable), without going through the ABC machinery
+        return callable(obj)
+
     def __repr__(self):
         return f"Callable[{self.args}, {self.ret}]"
 
+    def __eq__(self, other):
+        if type(other) != type(self):
+            return False
+        return self.args == other.args and self.ret == other.ret
+
+    def __hash__(self):
+        return hash((type(self), self.args, self.ret))
+
 
 Object = PythonDataType(object)
 Iter = SequenceType(PythonDataType(collections.abc.Iterable))
@@ -375,11 +627,15 @@ class _Bool(PythonDataType):
 
 class _Number(PythonDataType):
     def __call__(self, min=None, max=None):
-        predicates = []
-        if min is not None:
-            predicates += [lambda i: i >= min]
-        if max is not None:
-            predicates += [lambda i: i <= max]
+        # A single predicate for both bounds, so validation makes only one call
+        if min is not None and max is not None:
+            predicates = [lambda i: min <= i <= max]
+        elif min is not None:
+            predicates = [lambda i: i >= min]
+        elif max is not None:
+            predicates = [lambda i: i <= max]
+        else:
+            predicates = []
 
         return Constraint(self, predicates)
 
@@ -400,13 +656,14 @@ class _Float(_Number):
 
 class _String(PythonDataType):
     def __call__(self, min_length=None, max_length=None):
-        predicates = []
-        if min_length is not None:
-            predicates += [lambda s: len(s) >= min_length]
-        if max_length is not None:
-            predicates += [lambda s: len(s) <= max_length]
-
-        if not predicates:
+        # A single predicate for both bounds, so validation makes only one call
+        if min_length is not None and max_length is not None:
+            predicates = [lambda s: min_length <= len(s) <= max_length]
+        elif min_length is not None:
+            predicates = [lambda s: len(s) >= min_length]
+        elif max_length is not None:
+            predicates = [lambda s: len(s) <= max_length]
+        else:
             return self
 
         return Constraint(self, predicates)
@@ -494,9 +751,113 @@ _type_cast_mapping = {
     date: Date,
     time: Time,
     timedelta: TimeDelta,
+
+    # Unparameterized aliases from the typing module
+    typing.List: List,
+    typing.Dict: Dict,
+    typing.Set: Set,
+    typing.FrozenSet: FrozenSet,
+    typing.Tuple: Tuple,
+    typing.Mapping: Mapping,
+    typing.MutableMapping: MutableMapping,
+    typing.Sequence: Sequence,
+    typing.MutableSequence: MutableSequence,
+    typing.Callable: Callable,
+    typing.IO: PythonDataType(io.IOBase),
+    typing.TextIO: PythonDataType(io.TextIOBase),
+    typing.BinaryIO: PythonDataType(io.BytesIO),
+}
+
+
+def _canon_item_generic(generic):
+    "Returns a function that canonizes a generic with a single item type, into the given canonical generic"
+    def canon(to_canon, args):
+        x ,= args
+        return generic[to_canon(x)]
+    return canon
+
+def _canon_mapping_generic(generic):
+    "Returns a function that canonizes a generic with key and value types, into the given canonical generic"
+    def canon(to_canon, args):
+        k, v = args
+        return generic[to_canon(k), to_canon(v)]
+    return canon
+
+def _canon_tuple(to_canon, args):
+    if not args:
+        return Tuple
+    if Ellipsis in args:
+        if len(args) != 2 or args[0] == Ellipsis:
+            raise ValueError("Tuple with '...' expected to be of the exact form: tuple[t, ...].")
+        return TupleEllipsis[to_canon(args[0])]
+
+    return ProductType([to_canon(x) for x in args])
+
+def _canon_union(to_canon, args):
+    return SumType.create([to_canon(x) for x in args])
+
+def _canon_callable(to_canon, args):
+    return Callable[ProductType(to_canon(x) for x in args[:-1]), to_canon(args[-1])]
+
+def _canon_literal(to_canon, args):
+    return OneOf(args)
+
+def _canon_type(to_canon, args):
+    if args:
+        t ,= args
+        return Type[to_canon(t)]
+    # TODO test issubclass on t.__args__
+    return Type
+
+
+# Origins of parameterized generics, mapped to the function that canonizes them from their arguments.
+# Looked up by TypeCaster._to_canon(), instead of comparing the origin against each one in turn.
+_generic_origin_mapping = {
+    tuple: _canon_tuple,
+    typing.Union: _canon_union,
+    abc.Callable: _canon_callable,
+    typing.Callable: _canon_callable,
+    typing.Literal: _canon_literal,
+    type: _canon_type,
+    typing.Type: _canon_type,
+    list: _canon_item_generic(List),
+    set: _canon_item_generic(Set),
+    frozenset: _canon_item_generic(FrozenSet),
+    dict: _canon_mapping_generic(Dict),
+    abc.Mapping: _canon_mapping_generic(Mapping),
+    typing.Mapping: _canon_mapping_generic(Mapping),
+    abc.MutableMapping: _canon_mapping_generic(MutableMapping),
+    typing.MutableMapping: _canon_mapping_generic(MutableMapping),
+    abc.Sequence: _canon_item_generic(Sequence),
+    typing.Sequence: _canon_item_generic(Sequence),
+    abc.MutableSequence: _canon_item_generic(MutableSequence),
+    typing.MutableSequence: _canon_item_generic(MutableSequence),
+    abc.MutableSet: _canon_item_generic(Set),
+    typing.MutableSet: _canon_item_generic(Set),
+    abc.Set: _canon_item_generic(AbstractSet),
+    typing.AbstractSet: _canon_item_generic(AbstractSet),
 }
 
 
+# Canonical types are interned, so that equal types are usually also the same object.
+# That lets dict lookups and comparisons succeed on their identity check, without calling __eq__.
+_interned_types: "weakref.WeakValueDictionary[PythonType, PythonType]" = weakref.WeakValueDictionary()
+
+def _intern_type(t):
+    try:
+        return _interned_types.setdefault(t, t)
+    except TypeError:   # Not hashable, or doesn't support weak references
+        return t
+
+# Seeded with the predefined types, so equal types resolve to them (e.g. PythonDataType(bytes) to Bytes)
+for _t in _type_cast_mapping.values():
+    _intern_type(_t)
+
+
+# Metaclasses of classes that canonize to a PythonDataType, without probing for __origin__ and such
+_plain_metaclasses = (type, ABCMeta)
+
+
 class ATypeCaster(ABC):
     @abstractmethod
     def to_canon(self, t: typing.Any): ...
@@ -505,11 +866,19 @@ class ATypeCaster(ABC):
 class TypeCaster(ATypeCaster):
     def __init__(self, frame: typing.Optional[FrameType]=None):
         self.cache: typing.Dict[typing.Union[type, PythonType], PythonType] = {}
+        # Same as cache, but keyed by id(), for types that aren't plain classes.
+        # Generic aliases compute their hash in Python, from all their arguments, which is slow.
+        # Each entry holds on to its type, so that its id can't be reused.
+        self.id_cache: typing.Dict[int, typing.Tuple[typing.Any, PythonType]] = {}
         self.frame = frame
 
     def _to_canon(self, t):
         to_canon = self.to_canon
 
+        if type(t) in _plain_metaclasses:
+            # Plain classes (the usual case) can't be any of the special forms tested below
+            return PythonDataType(t)
+
         if isinstance(t, (base_types.Type, Validator)):
             return t
 
@@ -521,47 +890,16 @@ class TypeCaster(ATypeCaster):
         if isinstance(t, tuple):
             return SumType.create([to_canon(x) for x in t])
 
-        if hasattr(types, 'UnionType') and isinstance(t, types.UnionType):
+        if isinstance(t, _union_types):
             res = [to_canon(x) for x in t.__args__]
             return SumType.create(res)
 
         origin = getattr(t, '__origin__', None)
-        if hasattr(typing, '_AnnotatedAlias') and isinstance(t, typing._AnnotatedAlias):
+        if isinstance(t, _annotated_alias_types):
             return to_canon(origin)
-
-        if typing_extensions:
-            if hasattr(typing_extensions, '_AnnotatedAlias') and isinstance(t, typing_extensions._AnnotatedAlias):
-                return to_canon(origin)
-            elif hasattr(typing_extensions, 'AnnotatedMeta') and isinstance(t, typing_extensions.AnnotatedMeta):
-                # Python 3.6
-                return to_canon(t.__args__[0])
-
-        if t is typing.List:
-            return List
-        elif t is typing.Dict:
-            return Dict
-        elif t is typing.Set:
-            return Set
-        elif t is typing.FrozenSet:
-            return FrozenSet
-        elif t is typing.Tuple:
-            return Tuple
-        elif t is typing.Mapping:
-            return Mapping
-        elif t is typing.MutableMapping:
-            return MutableMapping
-        elif t is typing.Sequence:
-            return Sequence
-        elif t is typing.MutableSequence:
-            return MutableSequence
-        elif t is typing.Callable:
-            return Callable
-        elif t is typing.IO:
-            return PythonDataType(io.IOBase)
-        elif t is typing.TextIO:
-            return PythonDataType(io.TextIOBase)
-        elif t is typing.BinaryIO:
-            return PythonDataType(io.BytesIO)
+        elif isinstance(t, _annotated_meta_types):
+            # Python 3.6
+            return to_canon(t.__args__[0])
 
         if origin is None:
             if isinstance(t, typing.TypeVar):
@@ -571,74 +909,40 @@ class TypeCaster(ATypeCaster):
 
         args = getattr(t, '__args__', None)
 
-        if origin is list:
-            x ,= args
-            return List[to_canon(x)]
-        elif origin is set:
-            x ,= args
-            return Set[to_canon(x)]
-        elif origin is frozenset:
-            x ,= args
-            return FrozenSet[to_canon(x)]
-        elif origin is dict:
-            k, v = args
-            return Dict[to_canon(k), to_canon(v)]
-        elif origin is tuple:
-            if not args:
-                return Tuple
-            if Ellipsis in args:
-                if len(args) != 2 or args[0] == Ellipsis:
-                    raise ValueError("Tuple with '...' expected to be of the exact form: tuple[t, ...].")
-                return TupleEllipsis[to_canon(args[0])]
-
-            return ProductType([to_canon(x) for x in args])
-
-        elif origin is typing.Union:
-            res = [to_canon(x) for x in args]
-            return SumType(res)
-        elif origin is abc.Callable or origin is typing.Callable:
-            return Callable[ProductType(to_canon(x) for x in args[:-1]), to_canon(args[-1])]
-        elif origin is typing.Literal:
-            return OneOf(args)
-        elif origin is abc.Mapping or origin is typing.Mapping:
-            k, v = args
-            return Mapping[to_canon(k), to_canon(v)]
-        elif origin is abc.MutableMapping or origin is typing.MutableMapping:
-            k, v = args
-            return MutableMapping[to_canon(k), to_canon(v)]
-        elif origin is abc.Sequence or origin is typing.Sequence:
-            x ,= args
-            return Sequence[to_canon(x)]
-        elif origin is abc.MutableSequence or origin is typing.MutableSequence:
-            x ,= args
-            return MutableSequence[to_canon(x)]
-        elif origin is abc.MutableSet or origin is typing.MutableSet:
-            x ,= args
-            return Set[to_canon(x)]
-        elif origin is abc.Set or origin is typing.AbstractSet:
-            x ,= args
-            return AbstractSet[to_canon(x)]
-        elif origin is type or origin is typing.Type:
-            if args:
-                t ,= args
-                return Type[self.to_canon(t)]
-            # TODO test issubclass on t.__args__
-            return Type
-        elif isinstance(t, typing._GenericAlias):
+        canon_generic = _generic_origin_mapping.get(origin)
+        if canon_generic is not None:
+            return canon_generic(to_canon, args)
+
+        if isinstance(t, typing._GenericAlias):
             return self._to_canon(origin)
 
         raise NotImplementedError("No support for type:", t)
 
     def to_canon(self, t) -> PythonType:
-        try:
-            return self.cache[t]
-        except KeyError:
-            try:
-                res = _type_cast_mapping[t]
-            except KeyError:
-                res = self._to_canon(t)
+        if type(t) in _plain_metaclasses:
+            res = self.cache.get(t)     # Canonical types are never None
+        else:
+            entry = self.id_cache.get(id(t))
+            if entry is not None and entry[0] is t:
+                return entry[1]
+            res = self.cache.get(t)
+            if res is not None:
+                self.id_cache[id(t)] = t, res
+
+        if res is None:
+            res = _type_cast_mapping.get(t)
+            if res is None and self.frame is not None and type(self) is TypeCaster:
+                # Types that don't need the frame to resolve are shared through the global type caster,
+                # so they are canonized only once, instead of once per frame.
+                # Subclasses may override _to_canon(), so they always canonize by themselves.
+                with suppress(RuntimeError):
+                    res = type_caster.to_canon(t)
+            if res is None:
+                res = _intern_type(self._to_canon(t))
             self.cache[t] = res     # memoize
-            return res
+            if type(t) not in _plain_metaclasses:
+                self.id_cache[id(t)] = t, res
+        return res
 
 
 type_caster = TypeCaster()
@@ -668,13 +972,11 @@ def le(self: PythonDataType, other: SequenceType):
 
 @dp
 def le(self: OneOf, other: OneOf):
-    return set(self.values) <= set(other.values)
+    # Uses the sets prepared by OneOf.__init__, instead of building new ones
+    return self._value_set <= other._value_set and all(
+        v in other._unhashable_values for v in self._unhashable_values
+    )
 
 @dp
 def le(self: OneOf, other: PythonType):
-    try:
-        for v in self.values:
-            other.validate_instance(v)
-    except TypeMismatchError:
-        return False
-    return True
\ No newline at end of file
+    return all(other.test_instance(v) for v in self.values)
\ No newline at end of file
@@ -1,8 +1,54 @@
 import inspect
+import types
 import contextvars
 from contextlib import contextmanager
 
+_CO_VARARGS = inspect.CO_VARARGS | inspect.CO_VARKEYWORDS
+
+
+def _get_simple_func_signatures(typesystem, f):
+    """Fast path for get_func_signatures(), for plain functions with only positional parameters.
+
+    Reads the code object directly, instead of constructing an inspect.Signature.
+    Returns None if the function isn't simple enough.
+    """
+    if not isinstance(f, types.FunctionType) or hasattr(f, '__wrapped__'):
+        return None
+    code = f.__code__
+    if code.co_kwonlyargcount or code.co_flags & _CO_VARARGS:
+        return None
+
+    n = code.co_argcount
+    annotations = f.__annotations__
+    defaults = f.__defaults__ or ()
+    first_default = n - len(defaults)
+
+    typesigs = []
+    typesig = []
+    for i, name in enumerate(code.co_varnames[:n]):
+        try:
+            t = annotations[name]
+        except KeyError:
+            t = typesystem.default_type
+        else:
+            # Canonize to detect more collisions on construction, instead of during dispatch
+            t = typesystem.to_canonical_type(t)
+
+        if i >= first_default:
+            # From now on, everything is optional
+            typesigs.append(list(typesig))
+
+        typesig.append(t)
+
+    typesigs.append(typesig)
+    return typesigs
+
+
 def get_func_signatures(typesystem, f):
+    typesigs = _get_simple_func_signatures(typesystem, f)
+    if typesigs is not None:
+        return typesigs
+
     sig = inspect.signature(f)
     typesigs = []
     typesig = []
@@ -1,6 +1,6 @@
 "User-facing API for validation"
 
-from typing import Any, Tuple, Union, Type
+from typing import Any, Tuple, Union, Type, Set
 from functools import wraps
 
 from .common import CHECK_TYPES
@@ -9,11 +9,28 @@ from .pytypes import TypeMismatchError, type_caster
 from . import pytypes
 from .typesystem import TypeSystem
 
+# Note: ensure_isa() and isa() skip type_caster for types that are already canonical.
+# The result would be the same object, but hashing generic types for the cache lookup is costly.
+# They also return early when 't' is exactly the class of 'obj', which is always an instance of it.
+
+# Classes of the canonical types seen so far.
+# Testing membership is faster than calling isinstance() with the PythonType ABC.
+_canonical_classes: Set[type] = set()
+
 def ensure_isa(obj, t, sampler=None):
     """Ensure 'obj' is of type 't'. Otherwise, throws a TypeError
     """
-    t = type_caster.to_canon(t)
-    t.validate_instance(obj, sampler)
+    if type(obj) is t:
+        return
+    # Already canonical, if its class is in _canonical_classes
+    ct = t
+    t_class = type(t)
+    if t_class not in _canonical_classes:
+        if isinstance(t, pytypes.PythonType):
+            _canonical_classes.add(t_class)
+        else:
+            ct = type_caster.to_canon(t)
+    ct.validate_instance(obj, sampler)
 
 
 def is_subtype(t1, t2):
@@ -22,6 +39,9 @@ def is_subtype(t1, t2):
 
     ct1 = type_caster.to_canon(t1)
     ct2 = type_caster.to_canon(t2)
+    # Every type is a subtype of All and Any. Test by identity, to skip the dispatch of '<='
+    if ct2 is pytypes.All or ct2 is pytypes.Any:
+        return True
     return ct1 <= ct2
 
 
@@ -30,7 +50,16 @@ def isa(obj: Any, t: Union[Type[Any], Tuple[Type[Any], ...]]) -> bool:
 
     Behaves like Python's isinstance, but supports the ``typing`` module and constraints.
     """
-    ct = type_caster.to_canon(t)
+    if type(obj) is t:
+        return True
+    # Already canonical, if its class is in _canonical_classes
+    ct: pytypes.PythonType = t  # type: ignore[assignment]
+    t_class = type(t)
+    if t_class not in _canonical_classes:
+        if isinstance(t, pytypes.PythonType):
+            _canonical_classes.add(t_class)
+        else:
+            ct = type_caster.to_canon(t)
     return ct.test_instance(obj)
 
 
@@ -39,15 +68,19 @@ def assert_isa(obj: Any, t: Union[Type[Any], Tuple[Type[Any], ...]]):
 
     Does nothing if Python is run with -O. (like the assert statement)
     """
-    if CHECK_TYPES:
-        try:
-            ensure_isa(obj, t)
-        except TypeMismatchError as e:
-            item_value, item_type = e.args
-            msg = f"Expected value of type '{t}', instead got '{obj!r}'."
-            if item_value is not obj:
-                msg += f"\n\n    Failed on item: '{item_value!r}', expected type '{item_type}'."
-            raise TypeError(msg)
+    try:
+        ensure_isa(obj, t)
+    except TypeMismatchError as e:
+        item_value, item_type = e.args
+        msg = f"Expected value of type '{t}', instead got '{obj!r}'."
+        if item_value is not obj:
+            msg += f"\n\n    Failed on item: '{item_value!r}', expected type '{item_type}'."
+        raise TypeError(msg)
+
+if not CHECK_TYPES:
+    # Decided once at import, so that callers don't pay for the check when running with -O
+    def assert_isa(obj: Any, t: Union[Type[Any], Tuple[Type[Any], ...]]):
+        """Does nothing, because Python is run with -O. (like the assert statement)"""
 
 
 
@@ -61,7 +94,10 @@ def issubclass(t1: Type[Any], t2: Union[Type[Any], Tuple[Type[Any], ...]]) -> bo
     Behaves like Python's issubclass, but supports the ``typing`` module.
     """
     if isinstance(t2, tuple):
-        return any(is_subtype(t1, i) for i in t2)
+        for i in t2:
+            if is_subtype(t1, i):
+                return True
+        return False
     return is_subtype(t1, t2)
 
 
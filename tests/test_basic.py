@@ -1,6 +1,7 @@
 import unittest
 from unittest import TestCase
 from collections import abc
+from abc import ABC
 import sys
 
 import typing
@@ -11,9 +12,10 @@ from dataclasses import FrozenInstanceError, field
 import logging
 logging.basicConfig(level=logging.INFO)
 
-from runtype import Dispatch, DispatchError, dataclass, isa, is_subtype, issubclass, assert_isa, String, Int, validate_func, cv_type_checking, multidispatch
+from runtype import Dispatch, DispatchError, PythonTyping, dataclass, isa, is_subtype, issubclass, assert_isa, String, Int, validate_func, cv_type_checking, multidispatch
 from runtype.dispatch import MultiDispatch
-from runtype.dataclass import Configuration
+from runtype.dataclass import Configuration, PythonConfiguration
+from runtype.pytypes import TypeCaster
 
 try:
     import typing_extensions
@@ -40,6 +42,15 @@ class TestIsa(TestCase):
         self.assertRaises(TypeError, isa, 1, 1)
         self.assertRaises(TypeError, issubclass, 1, 1)
 
+        # Virtual subclasses are taken into account, even after a previous check
+        class Base(ABC):
+            pass
+        class X:
+            pass
+        assert not is_subtype(X, Base)
+        Base.register(X)
+        assert is_subtype(X, Base)
+
         assert isa(object, Any)
         assert isa(Any, object)
 
@@ -259,6 +270,10 @@ class TestIsa(TestCase):
         assert is_subtype(dict, Any, )
         assert is_subtype(Any, dict)
 
+        assert isa(1, Union[Any, int])
+        assert isa("a", Union[Any, int])
+        assert isa(None, Union[int, Any])
+
     def test_all(self):
         assert is_subtype(int, object)
         assert not is_subtype(object, int)
@@ -320,6 +335,99 @@ class TestDispatch(TestCase):
         assert f(1) == 1
         assert f(1, 1) == 2
 
+    def test_arity(self):
+        dy = Dispatch()
+
+        @dy
+        def f(i:int):
+            return i
+        f1 = f
+
+        @dy
+        def f(i:int, j:int, k:int):
+            return i + j + k
+
+        @dy
+        def f():
+            return 0
+
+        # Earlier wrappers still dispatch to functions that were defined later
+        for g in (f1, f):
+            assert g() == 0
+            assert g(1) == 1
+            assert g(1, 2, 3) == 6
+            self.assertRaises(DispatchError, g, 1, 2)
+
+    def test_cache_size(self):
+        dy = MultiDispatch(PythonTyping(), cache_size=2)
+
+        @dy
+        def f(x: object):
+            return "object"
+
+        @dy
+        def f(x: int):
+            return "int"
+
+        assert f(1) == "int"
+        assert f("a") == "object"
+        assert f(1.5) == "object"
+        assert f(2) == "int"
+        assert len(dy.fname_to_tree[f.__qualname__]._cache) == 2
+
+        dy = MultiDispatch(PythonTyping(), cache_size=0)
+
+        @dy
+        def g(x: int):
+            return x
+
+        assert g(1) == g(1) == 1
+        assert not dy.fname_to_tree[g.__qualname__]._cache
+
+        dy = Dispatch(cache_size=0, shared_cache=True)
+        assert (dy.cache_size, dy.shared_cache) == (0, True)
+
+    def test_shared_cache(self):
+        dy1 = MultiDispatch(PythonTyping(), shared_cache=True)
+        dy2 = MultiDispatch(PythonTyping(), shared_cache=True)
+
+        @dy1
+        def f(x: int):
+            return 1
+
+        @dy2
+        def f(x: int):
+            return 2
+
+        @dy2
+        def f(x: int, y: int):
+            return 3
+
+        f1 = dy1.fname_to_tree[f.__qualname__]
+        f2 = dy2.fname_to_tree[f.__qualname__]
+        assert f1._cache is f2._cache
+
+        assert f1.find_function_cached((1,))(1) == 1
+        assert f(1) == 2
+        assert f(1, 1) == 3
+
+        # cache_size=0 disables memoization, even when the shared cache is already in use
+        dy3 = MultiDispatch(PythonTyping(), cache_size=0, shared_cache=True)
+
+        @dy3
+        def g(x: int):
+            return x
+
+        cache_len = len(f1._cache)
+        assert g(1) == g(1) == 1
+        assert len(f1._cache) == cache_len
+        assert not dy3.fname_to_tree[g.__qualname__]._cache
+
+        dy2.clear_cache()
+        assert (f1, (int,)) in f1._cache
+        assert not any(k[0] is f2 for k in f2._cache)
+        assert f(1) == 2
+
     def test_basic3(self):
         dy = Dispatch()
 
@@ -1048,6 +1156,29 @@ class TestDataclass(TestCase):
         self.assertRaises(TypeError, A, 11, "a")
         self.assertRaises(TypeError, A, 3, "c")
 
+    def test_custom_type_caster(self):
+        class Foo:
+            pass
+
+        class FooCaster(TypeCaster):
+            def _to_canon(self, t):
+                if t is Foo:
+                    return String
+                return super()._to_canon(t)
+
+        class FooConfiguration(PythonConfiguration):
+            def make_type_caster(self, frame):
+                return FooCaster(frame)
+
+        @dataclass(config=FooConfiguration())
+        class A:
+            a: Foo
+            b: Optional[Foo] = None
+
+        A("a", "b")
+        self.assertRaises(TypeError, A, Foo())
+        self.assertRaises(TypeError, A, "a", Foo())
+
     def test_check_types(self):
         @dataclass(frozen=False, check_types=False)
         class A:
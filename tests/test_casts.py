@@ -3,6 +3,7 @@ from unittest import TestCase
 from typing import List, Dict
 
 from runtype import dataclass, String, Int, Dispatch
+from runtype.datetime_parse import parse_datetime
 
 class TestCasts(TestCase):
 
@@ -37,6 +38,9 @@ class TestCasts(TestCase):
         # test unix time
         unix_a = A('1095379199.75')
         assert unix_a == A('2004-09-16T23:59:59.75+00')
+        assert parse_datetime(1095379199.75) == unix_a.a
+        assert parse_datetime(1095379199) == A('2004-09-16T23:59:59+00').a
+        assert A('2004-09-16 23:59:59').a == datetime(2004, 9, 16, 23, 59, 59)
 
         @dataclass(check_types='cast')
         class B:
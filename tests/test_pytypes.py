@@ -6,7 +6,7 @@ import collections.abc as cabc
 import io
 
 from runtype.base_types import DataType, GenericType, PhantomType, Variance
-from runtype.pytypes import type_caster, List, Dict, Int, Any, All, Constraint, String, Tuple, Iter, Literal, NoneType, Sequence, Mapping    
+from runtype.pytypes import type_caster, TypeCaster, List, Dict, Int, Any, All, Constraint, String, Tuple, Iter, Literal, NoneType, Sequence, Mapping, SumType, PythonDataType
 from runtype.typesystem import TypeSystem
 
 make_type = type_caster.to_canon
@@ -76,6 +76,7 @@ class TestTypes(TestCase):
         assert Any + ((Any + Any) + Any) is Any
 
         assert (List+Dict) + Int == List + (Dict+Int)
+        assert SumType([List + Dict, Int]) == List + Dict + Int
         assert (List+Dict) != 1
         assert List + List == List
 
@@ -192,6 +193,9 @@ class TestTypes(TestCase):
         assert type_caster.to_canon(typing.List[int]).cast_from(()) == []
         assert type_caster.to_canon(typing.Dict[int, int]).cast_from({}) == {}
         assert type_caster.to_canon(typing.Dict[int, int]).cast_from([]) == {}
+        assert type_caster.to_canon(typing.List[int]).cast_from((1, 2)) == [1, 2]
+        assert type_caster.to_canon(typing.List[int]).cast_from(iter([1, 2])) == [1, 2]
+        assert type_caster.to_canon(typing.Dict[str, int]).cast_from({"a": 1}) == {"a": 1}
 
         tpl0 = type_caster.to_canon(typing.Tuple)
         tpl1 = type_caster.to_canon(typing.Tuple[int])
@@ -300,6 +304,79 @@ class TestTypes(TestCase):
         assert make_type(typing.Callable[[str, int], _Str]) <= repeat
         assert repeat <= make_type(typing.Callable[[_Str, int], str])
 
+    def test_interning(self):
+        if sys.version_info >= (3, 9):
+            assert make_type(typing.List[int]) is make_type(list[int])
+            assert make_type(typing.Dict[str, typing.Optional[int]]) is make_type(dict[str, typing.Union[int, None]])
+
+        a = make_type(typing.Callable[[str], int])
+        b = make_type(typing.Callable[[int], str])
+        assert a != b
+        assert a is not b
+        assert a == make_type(cabc.Callable[[str], int])
+
+        # Separate type casters share the interned instances
+        class A:
+            pass
+        assert TypeCaster().to_canon(A) is make_type(A)
+        assert TypeCaster().to_canon(typing.Optional[A]) is make_type(typing.Optional[A])
+
+        # Unions whose members canonize to the same type collapse into it
+        assert make_type(typing.Union[typing.List, list]) is make_type(list)
+
+    def test_sum_cast_is_stable(self):
+        # The result of a cast doesn't depend on previous casts
+        class Even(PythonDataType):
+            def cast_from(self, obj):
+                if obj % 2:
+                    raise TypeError()
+                return obj
+
+        class Other(PythonDataType):
+            def cast_from(self, obj):
+                return str(obj)
+
+        # (Several kernels, because the order of the members depends on their hash)
+        for kernel in (str, float, list, dict, set, frozenset):
+            sum_ = SumType([Even(kernel), Other(bytes)])
+            first = sum_.cast_from(2)
+            sum_.cast_from(1)
+            assert sum_.cast_from(2) == first
+
+    def test_abc_instance(self):
+        # Protocols with data members are decided per instance, not per class
+        @typing.runtime_checkable
+        class P(typing.Protocol):
+            x: int
+
+        class A:
+            pass
+
+        with_x = A()
+        with_x.x = 1
+        P_ = make_type(P)
+        assert P_.test_instance(with_x)
+        assert not P_.test_instance(A())
+
+        # Subclasses keep their own test_instance(), even with an ABC kernel
+        class NonEmpty(PythonDataType):
+            def test_instance(self, obj, sampler=None):
+                return super().test_instance(obj) and len(obj) > 0
+
+        non_empty = NonEmpty(cabc.Sized)
+        assert non_empty.test_instance([1])
+        assert not non_empty.test_instance([])
+
+        class Even(PythonDataType):
+            def test_instance(self, obj, sampler=None):
+                return super().test_instance(obj) and obj % 2 == 0
+
+        even = Even(int)
+        even.validate_instance(2)
+        self.assertRaises(TypeError, even.validate_instance, 3)
+        make_type(typing.Callable).validate_instance(len)
+        self.assertRaises(TypeError, make_type(typing.Callable).validate_instance, 1)
+
     def test_io(self):
         IO = make_type(io.IOBase)
         TextIO = make_type(io.TextIOBase)